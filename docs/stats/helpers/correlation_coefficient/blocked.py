@@ -0,0 +1,103 @@
+import os
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+blocksize = 1024
+
+
+def _memmap(path, shape, dtype=np.float32):
+    temporary = path is None
+    if temporary:
+        handle, path = tempfile.mkstemp(suffix='.dat')
+        os.close(handle)
+    array = np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                      shape=shape)
+    if temporary:
+        # views keep the memmap alive, so the file goes with the last one
+        weakref.finalize(array, os.remove, path)
+    return array
+
+
+def standardize(values, path=None, blocksize=blocksize):
+    n, p = values.shape
+    z = _memmap(path, (n, p))
+    for start in range(0, p, blocksize):
+        block = np.asarray(values[:, start:start + blocksize], dtype=float)
+        block = block - block.mean(axis=0)
+        z[:, start:start + blocksize] = block / np.sqrt((block ** 2).sum(axis=0))
+    return z
+
+
+def _numeric(data):
+    # numeric columns of a DataFrame with their labels, or a plain array
+    if hasattr(data, 'select_dtypes'):
+        data = data.select_dtypes('number')
+        return data.values, list(data.columns)
+    return data, None
+
+
+def corrcoef(data, path=None, blocksize=blocksize, max_workers=None):
+    values = _numeric(data)[0]
+    z = standardize(values)
+    p = z.shape[1]
+    cor = _memmap(path, (p, p))
+    starts = range(0, p, blocksize)
+    tiles = [(i, j) for i in starts for j in starts if i <= j]
+
+    def tile(ij):
+        i, j = ij
+        block = z[:, i:i + blocksize].T @ z[:, j:j + blocksize]
+        np.clip(block, -1, 1, out=block)
+        cor[i:i + blocksize, j:j + blocksize] = block
+        cor[j:j + blocksize, i:i + blocksize] = block.T
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        list(executor.map(tile, tiles))
+    np.fill_diagonal(cor, 1)
+    cor.flush()
+    return cor
+
+
+def _matmul(cor, basis, blocksize=blocksize):
+    basis = basis.astype(cor.dtype)
+    return np.concatenate([np.asarray(cor[start:start + blocksize]) @ basis
+                           for start in range(0, len(cor), blocksize)])
+
+
+def order(cor, n_iter=10, blocksize=blocksize, random_seed=0):
+    # angular order of the two leading eigenvectors (corrgram-style)
+    basis = np.random.default_rng(random_seed).normal(size=(len(cor), 2))
+    for _ in range(n_iter):
+        basis = np.linalg.qr(_matmul(cor, np.linalg.qr(basis)[0], blocksize))[0]
+    return np.argsort(np.arctan2(basis[:, 1], basis[:, 0]), kind='stable')
+
+
+def downsample(cor, size=100, order=None):
+    p = len(cor)
+    index = np.arange(p) if order is None else np.asarray(order)
+    edges = np.linspace(0, p, min(size, p) + 1).astype(int)
+    counts = np.diff(edges)
+    view = np.empty((len(counts), len(counts)))
+    for k in range(len(counts)):
+        rows = np.asarray(cor[np.sort(index[edges[k]:edges[k + 1]])],
+                          dtype=float)[:, index]
+        view[k] = np.add.reduceat(rows.sum(axis=0), edges[:-1]) / (
+            counts[k] * counts)
+    return view
+
+
+def subset(cor, columns, labels=None):
+    # labels: names of the columns of cor, or the frame given to corrcoef
+    if hasattr(labels, 'select_dtypes'):
+        labels = _numeric(labels)[1]
+    columns = np.asarray(columns)
+    values = np.asarray(cor[np.sort(columns)], dtype=float)
+    rank = np.argsort(np.argsort(columns))
+    values = values[rank][:, columns]
+    if labels is None:
+        return values
+    import pandas as pd
+    labels = [labels[i] for i in columns]
+    return pd.DataFrame(values, index=labels, columns=labels)
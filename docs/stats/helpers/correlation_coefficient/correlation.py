@@ -1,29 +1,93 @@
+from functools import lru_cache
 import numpy as np
-from scipy import stats
-from ipywidgets import interact, IntSlider, FloatSlider
-import matplotlib.pyplot as plt
-
-def plot(r, random_seed):
-    n = 100
-    np.random.seed(random_seed)
-    x = np.random.uniform(size=n)
-    e = np.random.uniform(size=n)
+from . import density
+from .sample import base, pearsonr
+
+n = 100
+
+
+def _draw(random_seed, n):
+    x, e = base(random_seed, n)
+    x, e = x[0], e[0]
+    x.flags.writeable = False
+    e.flags.writeable = False
+    return x, e
+
+
+# slider sweeps over seeds stay cached at small n; above the density
+# threshold only the latest draw is kept, so memory stays at one sample
+_small = lru_cache(maxsize=256)(_draw)
+_large = lru_cache(maxsize=1)(_draw)
+
+
+def sample(random_seed, n=n):
+    if n <= density.threshold:
+        return _small(random_seed, n)
+    return _large(random_seed, n)
+
+
+def title(r):
+    return '相関係数 $r_{xy}=' + '{r:.2f}$'.format(r=r)
+
+
+def update(artist, r, random_seed, n=n):
+    from matplotlib.image import AxesImage
+    x, e = sample(random_seed, n)
     y = r * x + np.sqrt(1 - r ** 2) * e
 
-    plt.figure(figsize=(5, 5))
-    ax = plt.axes()
-    ax.scatter(x - x.mean(), y - y.mean(), marker='.')
-    plt.setp(ax, title='相関係数 $r_{xy}=' + '{r:.2f}$'.format(r=stats.pearsonr(
-                                                                x, y)[0]),
-             xlabel='$x$', ylabel='$y$', xticks=(), yticks=())
+    ax = artist.axes
+    if isinstance(artist, AxesImage):
+        density.update(artist, x - x.mean(), y - y.mean())
+    else:
+        xy = np.column_stack((x - x.mean(), y - y.mean()))
+        artist.set_offsets(xy)
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(xy)
+        ax.autoscale_view()
+    ax.set_title(title(pearsonr(x, y)))
+
+
+def figure(n=n):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(5, 5))
+    if n > density.threshold:
+        artist = density.image(ax)
+    else:
+        artist = ax.scatter(np.zeros(n), np.zeros(n), marker='.')
+    plt.setp(ax, xlabel='$x$', ylabel='$y$', xticks=(), yticks=())
+    return fig, artist
+
 
+def plot(r, random_seed, n=n):
+    import matplotlib.pyplot as plt
+    fig, artist = figure(n)
+    update(artist, r, random_seed, n)
     plt.show()
 
-def show():
+
+def show(n=n):
+    from ipywidgets import IntSlider, FloatSlider, Output, VBox
+    from IPython.display import display
+    import matplotlib.pyplot as plt
     style = dict(description_width='7em')
     r = FloatSlider(value=0, min=-1, max=1, step=0.1,
                     description='相関係数 (目安)', continuous_update=False,
                     readout_format='.1f', style=style)
     seed = IntSlider(value=1, min=1, max=256, description='乱数',
                      continuous_update=False, style=style)
-    interact(plot, r=r, random_seed=seed)
+
+    fig, artist = figure(n)
+    plt.close(fig)
+    output = Output()
+
+    def redraw(change=None):
+        update(artist, r.value, seed.value, n)
+        fig.canvas.draw_idle()
+        with output:
+            output.clear_output(wait=True)
+            display(fig)
+
+    r.observe(redraw, names='value')
+    seed.observe(redraw, names='value')
+    redraw()
+    display(VBox([r, seed, output]))
@@ -0,0 +1,53 @@
+import numpy as np
+
+threshold = 10000
+bins = 128
+chunksize = 1 << 20
+
+
+def histogram2d(x, y, bins=bins, extent=None):
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if extent is None:
+        finite = np.isfinite(x) & np.isfinite(y)
+        extent = (x[finite].min(), x[finite].max(),
+                  y[finite].min(), y[finite].max())
+    xmin, xmax, ymin, ymax = extent
+    xscale = bins / ((xmax - xmin) or 1)
+    yscale = bins / ((ymax - ymin) or 1)
+
+    counts = np.zeros(bins * bins, dtype=np.int64)
+    for start in range(0, len(x), chunksize):
+        xs, ys = x[start:start + chunksize], y[start:start + chunksize]
+        inside = (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax)
+        ix = ((xs[inside] - xmin) * xscale).astype(np.intp)
+        iy = ((ys[inside] - ymin) * yscale).astype(np.intp)
+        np.minimum(ix, bins - 1, out=ix)
+        np.minimum(iy, bins - 1, out=iy)
+        counts += np.bincount(ix * bins + iy, minlength=bins * bins)
+    return counts.reshape(bins, bins), extent
+
+
+def image(ax, cmap='viridis'):
+    from matplotlib.colors import LogNorm
+    return ax.imshow(np.ma.masked_all((1, 1)), origin='lower', aspect='auto',
+                     interpolation='nearest', cmap=cmap, norm=LogNorm())
+
+
+def update(artist, x, y, bins=bins):
+    counts, extent = histogram2d(x, y, bins)
+    artist.set_data(np.ma.masked_equal(counts.T, 0))
+    artist.set_extent(extent)
+    artist.set_clim(1, max(counts.max(), 1))
+
+
+def hist(x, bins=bins, color=None, **kwargs):
+    import matplotlib.pyplot as plt
+    x = np.asarray(x, dtype=float)
+    counts, edges = np.histogram(x[np.isfinite(x)], bins=bins)
+    plt.gca().stairs(counts, edges, fill=True, color=color)
+
+
+def plot(x, y, bins=bins, cmap='viridis', **kwargs):
+    import matplotlib.pyplot as plt
+    update(image(plt.gca(), cmap), x, y, bins)
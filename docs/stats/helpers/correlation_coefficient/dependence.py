@@ -0,0 +1,143 @@
+import time
+import numpy as np
+from .sample import pearsonr
+
+
+def _dense_rank(values):
+    return np.unique(values, return_inverse=True)[1].ravel()
+
+
+def _greater_before(values, weights):
+    # for each j, sum of weights[i] over i < j with values[i] > values[j],
+    # by a bottom-up merge sort whose merges are stable sorts of two runs
+    n = len(values)
+    values, weights = np.asarray(values), np.asarray(weights, dtype=float)
+    ids, idx = np.arange(n), np.arange(n)
+    out = np.zeros_like(weights)
+    width = 1
+    while width < n:
+        pair = idx // (2 * width)
+        right = (idx // width) % 2 == 1
+        order = np.argsort(pair * n + values, kind='stable')
+
+        cum = np.cumsum(np.where(right[:, None], 0, weights)[order], axis=0)
+        end = np.minimum((pair + 1) * 2 * width, n) - 1
+        greater = cum[end] - cum
+
+        merged_right = right[order]
+        out[ids[order][merged_right]] += greater[merged_right]
+        values, weights, ids = values[order], weights[order], ids[order]
+        width *= 2
+    return out
+
+
+def _ties(*columns):
+    order = np.lexsort(columns[::-1])
+    sorted_columns = [c[order] for c in columns]
+    change = np.zeros(len(order), dtype=bool)
+    change[0] = True
+    for c in sorted_columns:
+        change[1:] |= c[1:] != c[:-1]
+    counts = np.diff(np.append(np.flatnonzero(change), len(order)))
+    return (counts * (counts - 1) // 2).sum()
+
+
+def spearman(x, y):
+    from scipy import stats
+    return pearsonr(stats.rankdata(x), stats.rankdata(y))
+
+
+def kendall_tau(x, y):
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n = len(x)
+    order = np.lexsort((y, x))
+    discordant = _greater_before(_dense_rank(y)[order], np.ones((n, 1))).sum()
+
+    n0 = n * (n - 1) / 2
+    n1, n2, n3 = _ties(x), _ties(y), _ties(x, y)
+    return (n0 - n1 - n2 + n3 - 2 * discordant) / np.sqrt((n0 - n1) *
+                                                           (n0 - n2))
+
+
+def _row_sums(x):
+    order = np.argsort(x, kind='stable')
+    xs = x[order]
+    k = np.arange(len(x))
+    before = np.cumsum(xs) - xs
+    after = xs.sum() - before - xs
+    sums = np.empty_like(x)
+    sums[order] = xs * k - before + after - xs * (len(x) - 1 - k)
+    return sums
+
+
+def _dcov2(x, y=None):
+    n = len(x)
+    if y is None:
+        y = x
+        ab = 2 * (n * (x @ x) - x.sum() ** 2)
+    else:
+        order = np.lexsort((y, x))
+        xs, ys = x[order], y[order]
+        weights = np.column_stack((np.ones(n), xs, ys, xs * ys))
+        c, sx, sy, sxy = _greater_before(_dense_rank(ys), weights).T
+
+        product = n * (xs @ ys) - xs.sum() * ys.sum()
+        discordant = (xs * ys * c - xs * sy - ys * sx + sxy).sum()
+        ab = 2 * (product - 2 * discordant)
+
+    a, b = _row_sums(x), _row_sums(y)
+    return ab / n ** 2 + a.sum() * b.sum() / n ** 4 - 2 * (a @ b) / n ** 3
+
+
+def distance_correlation(x, y):
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x, y = x - x.mean(), y - y.mean()
+    denominator = np.sqrt(_dcov2(x) * _dcov2(y))
+    if denominator <= 0:
+        return 0.0
+    return np.sqrt(max(_dcov2(x, y), 0) / denominator)
+
+
+measures = {
+    'Pearson $r$': pearsonr,
+    'Spearman $\\rho$': spearman,
+    'Kendall $\\tau$': kendall_tau,
+    'dCor': distance_correlation,
+}
+
+
+def show():
+    import matplotlib.pyplot as plt
+    x = np.linspace(-1, 1, 200)
+    e = np.random.RandomState(1).normal(scale=0.1, size=len(x))
+    samples = {'$y=x$': x + e, '$y=x^{2}$': x ** 2 + e,
+               '$y=\\sin 2\\pi x$': np.sin(2 * np.pi * x) + e,
+               '$y=e^{5x}$': np.exp(5 * x)}
+
+    _, axes = plt.subplots(1, len(samples), figsize=(5 * len(samples), 5))
+    for ax, (name, y) in zip(axes, samples.items()):
+        ax.scatter(x, y, marker='.')
+        text = '\n'.join('{}$={:.2f}$'.format(label, measure(x, y))
+                         for label, measure in measures.items())
+        ax.text(0.03, 0.97, text, transform=ax.transAxes,
+                verticalalignment='top',
+                bbox=dict(facecolor='white', alpha=0.8))
+        plt.setp(ax, title=name, xlabel='$X$', ylabel='$Y$', xticks=(),
+                 yticks=())
+    plt.show()
+
+
+def benchmark(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), random_seed=0):
+    import pandas as pd
+    rng = np.random.default_rng(random_seed)
+    rows = []
+    for n in sizes:
+        x = rng.normal(size=n)
+        y = x ** 2 + rng.normal(size=n)
+        row = {'n': n}
+        for label, measure in measures.items():
+            start = time.perf_counter()
+            measure(x, y)
+            row[label] = time.perf_counter() - start
+        rows.append(row)
+    return pd.DataFrame(rows).set_index('n')
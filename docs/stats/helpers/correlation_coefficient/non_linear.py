@@ -1,8 +1,8 @@
 import numpy as np
-from scipy import stats
-import matplotlib.pyplot as plt
 
 def show():
+    from scipy import stats
+    import matplotlib.pyplot as plt
     x = np.linspace(-1, 1, 9)
     y = x ** 2
     r = stats.pearsonr(x, y)[0]
@@ -0,0 +1,52 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+
+batch_elements = 1 << 23
+
+
+def _standardize(v):
+    v = np.asarray(v, dtype=float)
+    v = v - v.mean()
+    return v / np.sqrt(v @ v)
+
+
+def _null(x, y, seed, size):
+    rng = np.random.default_rng(seed)
+    index = np.tile(np.arange(len(y), dtype=np.int32), (size, 1))
+    rng.permuted(index, axis=1, out=index)
+    return y[index] @ x
+
+
+def _batches(n, n_permutations, random_seed):
+    size = max(1, min(n_permutations, batch_elements // n))
+    sizes = [size] * (n_permutations // size)
+    if n_permutations % size:
+        sizes.append(n_permutations % size)
+    seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+    return seeds, sizes
+
+
+def distribution(x, y, n_permutations=10000, random_seed=0,
+                 max_workers=1):
+    x, y = _standardize(x), _standardize(y)
+    seeds, sizes = _batches(len(x), n_permutations, random_seed)
+    null = partial(_null, x, y)
+    if max_workers == 1:
+        return x @ y, np.concatenate(list(map(null, seeds, sizes)))
+    with ProcessPoolExecutor(max_workers) as executor:
+        return x @ y, np.concatenate(list(executor.map(null, seeds, sizes)))
+
+
+def test(x, y, n_permutations=10000, alternative='two-sided', random_seed=0,
+         max_workers=1):
+    r, null = distribution(x, y, n_permutations, random_seed, max_workers)
+    if alternative == 'two-sided':
+        extreme = np.abs(null) >= np.abs(r) - 1e-12
+    elif alternative == 'greater':
+        extreme = null >= r - 1e-12
+    elif alternative == 'less':
+        extreme = null <= r + 1e-12
+    else:
+        raise ValueError(alternative)
+    return r, (extreme.sum() + 1) / (n_permutations + 1)
@@ -0,0 +1,33 @@
+import numpy as np
+
+
+def generator(random_seed):
+    # MT19937 seeded like np.random.seed so figures match the legacy ones
+    bit_generator = np.random.MT19937()
+    bit_generator.state = np.random.RandomState(
+        random_seed).get_state(legacy=False)
+    return np.random.Generator(bit_generator)
+
+
+def base(random_seeds, n=100):
+    random_seeds = np.atleast_1d(random_seeds)
+    draws = np.empty((len(random_seeds), 2, n))
+    for i, random_seed in enumerate(random_seeds):
+        generator(int(random_seed)).random(out=draws[i].reshape(-1))
+    return draws[:, 0], draws[:, 1]
+
+
+def pearsonr(x, y, axis=-1):
+    xc = x - x.mean(axis=axis, keepdims=True)
+    yc = y - y.mean(axis=axis, keepdims=True)
+    return ((xc * yc).sum(axis=axis) /
+            np.sqrt((xc ** 2).sum(axis=axis) * (yc ** 2).sum(axis=axis)))
+
+
+def generate(random_seeds, rs, n=100):
+    x, e = base(random_seeds, n)
+    rs = np.atleast_1d(np.asarray(rs, dtype=float))[None, :, None]
+    x, e = x[:, None, :], e[:, None, :]
+    y = rs * x + np.sqrt(1 - rs ** 2) * e
+    x = np.broadcast_to(x, y.shape)
+    return x, y, pearsonr(x, y)
@@ -0,0 +1,56 @@
+import numpy as np
+from . import density as _density
+from . import significance
+
+
+def standardize(values):
+    values = np.asarray(values, dtype=float)
+    centered = values - values.mean(axis=0)
+    return centered / np.sqrt((centered ** 2).sum(axis=0))
+
+
+def corrcoef(values):
+    z = standardize(values)
+    cor = z.T @ z
+    np.fill_diagonal(cor, 1)
+    return np.clip(cor, -1, 1)
+
+
+def paint_upper(matrix, cor, vmin=-1, vmax=1, cmap=None, pvalues=None,
+                alpha=0.05, **kwargs):
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import Normalize
+    from matplotlib.cm import ScalarMappable
+    sm = ScalarMappable(Normalize(vmin=vmin, vmax=vmax), plt.get_cmap(cmap))
+    colors = sm.to_rgba(cor)
+    labels = np.char.mod('%.2f', cor)
+    if pvalues is not None:
+        labels = np.char.add(labels, significance.stars(pvalues))
+        colors[pvalues >= alpha] = (1, 1, 1, 1)
+    for i, j in zip(*np.triu_indices_from(matrix.axes, 1)):
+        ax = matrix.axes[i, j]
+        ax.text(0.5, 0.5, labels[i, j], transform=ax.transAxes,
+                horizontalalignment='center', verticalalignment='center',
+                **kwargs)
+        ax.axes.xaxis.set_visible(False)
+        ax.axes.yaxis.set_visible(False)
+        plt.setp(ax, facecolor=colors[i, j])
+
+
+def corr_scatter_matrix(data, size=1.5, cmap='seismic', density=None,
+                        cor=None, alpha=None, **kwargs):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if density is None:
+        density = len(data) > _density.threshold
+    matrix = sns.PairGrid(data, height=size)
+    if cor is None:
+        cor = corrcoef(data[matrix.x_vars].values)
+    cor = np.asarray(cor)
+    if alpha is not None:
+        kwargs.update(pvalues=significance.pvalue(cor, len(data)),
+                      alpha=alpha)
+    paint_upper(matrix, cor, cmap=cmap, **kwargs)
+    matrix.map_lower(_density.plot if density else plt.scatter)
+    matrix.map_diag(_density.hist if density else sns.histplot)
+    plt.show()
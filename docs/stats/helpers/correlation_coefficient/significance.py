@@ -0,0 +1,47 @@
+import numpy as np
+from . import scatter_matrix
+
+
+def pvalue(r, n):
+    from scipy import stats
+    r = np.asarray(r, dtype=float)
+    dof = n - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = r * np.sqrt(dof / ((1 - r) * (1 + r)))
+    return 2 * stats.t.sf(np.abs(t), dof)
+
+
+def interval(r, n, alpha=0.05):
+    from scipy import stats
+    z = np.arctanh(np.clip(r, -1, 1))
+    half = stats.norm.ppf(1 - alpha / 2) / np.sqrt(n - 3)
+    return np.tanh(z - half), np.tanh(z + half)
+
+
+def corrtest(data, alpha=0.05):
+    import pandas as pd
+    values = data.select_dtypes('number')
+    columns = values.columns
+    values = values.dropna().values
+    n = len(values)
+    r = scatter_matrix.corrcoef(values)
+    lower, upper = interval(r, n, alpha)
+    return tuple(pd.DataFrame(a, index=columns, columns=columns)
+                 for a in (r, pvalue(r, n), lower, upper))
+
+
+def stars(p):
+    p = np.asarray(p)
+    return np.select([p < 0.001, p < 0.01, p < 0.05], ['***', '**', '*'], '')
+
+
+def heatmap(data, alpha=0.05, **kwargs):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    r, p, _, _ = corrtest(data, alpha)
+    labels = np.char.add(np.char.mod('%.2f', r.values), stars(p.values))
+    options = dict(vmin=-1, vmax=1, cmap='seismic', square=True, fmt='')
+    options.update(kwargs)
+    ax = sns.heatmap(r, mask=p.values >= alpha, annot=labels, **options)
+    plt.show()
+    return ax
@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce as _reduce
+import numpy as np
+
+
+class Moments:
+    def __init__(self, columns=None):
+        self.columns = columns
+        self.n = 0
+        self.mean = None
+        self.comoment = None
+
+    def update(self, block):
+        if hasattr(block, 'select_dtypes'):
+            block = block.select_dtypes('number')
+            if self.columns is None:
+                self.columns = list(block.columns)
+            block = block.values
+        block = np.asarray(block, dtype=float)
+        if block.ndim == 1:
+            block = block[:, None]
+        block = block[np.isfinite(block).all(axis=1)]
+        if len(block) == 0:
+            return self
+
+        other = Moments(self.columns)
+        other.n = len(block)
+        other.mean = block.mean(axis=0)
+        centered = block - other.mean
+        other.comoment = centered.T @ centered
+        return self.merge(other)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.columns = self.columns or other.columns
+            self.n = other.n
+            self.mean = other.mean.copy()
+            self.comoment = other.comoment.copy()
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment += other.comoment + np.outer(delta, delta) * (
+            self.n * other.n / n)
+        self.mean += delta * (other.n / n)
+        self.n = n
+        return self
+
+    def cov(self, ddof=1):
+        return self._frame(self.comoment / (self.n - ddof))
+
+    def corr(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        cor = np.clip(self.comoment / np.outer(scale, scale), -1, 1)
+        np.fill_diagonal(cor, 1)
+        return self._frame(cor)
+
+    def _frame(self, values):
+        if self.columns is None:
+            return values
+        import pandas as pd
+        return pd.DataFrame(values, index=self.columns, columns=self.columns)
+
+
+def pearsonr(x, y, chunksize=1 << 20):
+    moments = Moments()
+    for start in range(0, len(x), chunksize):
+        moments.update(np.column_stack((x[start:start + chunksize],
+                                        y[start:start + chunksize])))
+    return np.asarray(moments.corr())[0, 1]
+
+
+def from_blocks(blocks):
+    moments = Moments()
+    for block in blocks:
+        moments.update(block)
+    return moments
+
+
+def read_csv(path, chunksize=100000, **kwargs):
+    import pandas as pd
+    return from_blocks(pd.read_csv(path, chunksize=chunksize, **kwargs))
+
+
+def reduce(states):
+    return _reduce(Moments.merge, states, Moments())
+
+
+def read_csvs(paths, chunksize=100000, max_workers=None, **kwargs):
+    with ProcessPoolExecutor(max_workers) as executor:
+        return reduce(executor.map(
+            partial(read_csv, chunksize=chunksize, **kwargs), paths))
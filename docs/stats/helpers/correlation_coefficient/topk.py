@@ -0,0 +1,85 @@
+import heapq
+import numpy as np
+from .scatter_matrix import standardize
+
+
+def _pairwise(values, y):
+    # Pearson r on pairwise-complete rows, as DataFrame.corr does
+    mask = np.isfinite(values) & np.isfinite(y)[:, None]
+    n = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x = np.where(mask, values, 0)
+        yy = np.where(mask, y[:, None], 0)
+        x = np.where(mask, x - x.sum(axis=0) / n, 0)
+        yy = np.where(mask, yy - yy.sum(axis=0) / n, 0)
+        return (x * yy).sum(axis=0) / np.sqrt(
+            (x ** 2).sum(axis=0) * (yy ** 2).sum(axis=0))
+
+
+def _push(heap, k, positions, names, r, absolute):
+    # constant columns and columns without complete rows have no r
+    finite = np.isfinite(r)
+    positions, r = positions[finite], r[finite]
+    names = [name for name, keep in zip(names, finite) if keep]
+    scores = np.abs(r) if absolute else r
+    if len(scores) > k:
+        # stable pre-selection: ties keep the earlier column here too
+        keep = np.lexsort((positions, -scores))[:k]
+        positions, names = positions[keep], [names[i] for i in keep]
+        r, scores = r[keep], scores[keep]
+    for position, name, value, score in zip(positions, names, r, scores):
+        # ties keep the earlier column; labels are never compared
+        item = (score, -position, name, value)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+
+def correlations(blocks, y, k=3, absolute=True):
+    import pandas as pd
+    y = np.asarray(y, dtype=float)
+    complete = np.isfinite(y).all()
+    z = standardize(y) if complete else None
+    heap = []
+    offset = 0
+    for block in blocks:
+        names = list(block.columns)
+        values = np.asarray(block.values, dtype=float)
+        if complete and np.isfinite(values).all():
+            with np.errstate(invalid='ignore', divide='ignore'):
+                r = standardize(values).T @ z
+        else:
+            r = _pairwise(values, y)
+        _push(heap, k, np.arange(offset, offset + len(names)), names, r,
+              absolute)
+        offset += len(names)
+    top = sorted(heap, reverse=True)
+    return pd.Series([value for _, _, _, value in top],
+                     index=[name for _, _, name, _ in top])
+
+
+def _blocks(data, columns, blocksize):
+    for start in range(0, len(columns), blocksize):
+        yield data[columns[start:start + blocksize]]
+
+
+def nlargest(data, target, k=3, blocksize=1024, absolute=True):
+    columns = [c for c in data.select_dtypes('number').columns if c != target]
+    top = correlations(_blocks(data, columns, blocksize), data[target].values,
+                       k, absolute)
+    cols = [target] + list(top.index)
+    return data[cols].corr()
+
+
+def read_csv(path, target, k=3, blocksize=1024, absolute=True, **kwargs):
+    import pandas as pd
+    header = pd.read_csv(path, nrows=0, **kwargs).columns
+    y = pd.read_csv(path, usecols=[target], **kwargs)[target].values
+    columns = [c for c in header if c != target]
+    blocks = (pd.read_csv(path, usecols=columns[start:start + blocksize],
+                          **kwargs).select_dtypes('number')
+              for start in range(0, len(columns), blocksize))
+    top = correlations(blocks, y, k, absolute)
+    cols = [target] + list(top.index)
+    return pd.read_csv(path, usecols=cols, **kwargs)[cols].corr()
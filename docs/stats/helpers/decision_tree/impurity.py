@@ -1,8 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def show():
+    import matplotlib.pyplot as plt
     eps = np.finfo(np.float).eps
     x = np.linspace(eps, 1 - eps, 30)
     gini = 1 - (x ** 2 + (1 - x) ** 2)
@@ -0,0 +1,99 @@
+from collections import OrderedDict, namedtuple
+import hashlib
+
+Design = namedtuple('Design', ['endog', 'exog', 'formula_kwargs', 'nbytes'])
+
+max_bytes = 1 << 28
+
+
+def fingerprint(data):
+    import pandas as pd
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(zip(data.columns, data.dtypes.astype(str))))
+                  .encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).values)
+    return digest.hexdigest()
+
+
+class Cache:
+    # least recently used design matrices, bounded by their total size
+    def __init__(self, max_bytes=max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._designs = OrderedDict()
+
+    def __len__(self):
+        return len(self._designs)
+
+    def design(self, formula, data, eval_env=None):
+        # eval_env resolves free names such as np.log or notebook
+        # functions; it is not part of the key, so a formula whose free
+        # names are rebound between calls still hits the first design
+        import statsmodels.formula.api as smf
+        key = formula, fingerprint(data)
+        if key in self._designs:
+            self.hits += 1
+            self._designs.move_to_end(key)
+            return self._designs[key]
+        self.misses += 1
+        # any formula model will do: only its design matrices are kept
+        data_ = smf.ols(formula, data=data, eval_env=eval_env).data
+        nbytes = (data_.orig_endog.memory_usage(index=True).sum() +
+                  data_.orig_exog.memory_usage(index=True).sum())
+        # what Model.from_formula hands the model besides endog/exog
+        formula_kwargs = {'formula': formula,
+                          'missing_idx': data_.missing_row_idx,
+                          'model_spec': data_.model_spec}
+        design = Design(data_.orig_endog, data_.orig_exog, formula_kwargs,
+                        int(nbytes))
+        if nbytes <= self.max_bytes:
+            self._designs[key] = design
+            self.nbytes += design.nbytes
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._designs.popitem(last=False)[1].nbytes
+        return design
+
+    def clear(self):
+        self._designs.clear()
+        self.nbytes = 0
+
+    def model(self, model_class, formula, data, eval_env=None, **kwargs):
+        design = self.design(formula, data, eval_env)
+        model = model_class(design.endog, design.exog,
+                            **design.formula_kwargs, **kwargs)
+        model.formula = formula
+        model.data.frame = data
+        return model
+
+
+cache = Cache()
+
+
+def _environment(eval_env, depth):
+    # like smf.*: an int counts frames up from the caller of ols/logit/glm
+    from patsy import EvalEnvironment
+    if eval_env is None:
+        eval_env = 0
+    if isinstance(eval_env, int) and eval_env >= 0:
+        return EvalEnvironment.capture(eval_env + depth + 1)
+    return eval_env
+
+
+def ols(formula, data, eval_env=None, **kwargs):
+    import statsmodels.api as sm
+    return cache.model(sm.OLS, formula, data, _environment(eval_env, 1),
+                       **kwargs)
+
+
+def logit(formula, data, eval_env=None, **kwargs):
+    import statsmodels.api as sm
+    return cache.model(sm.Logit, formula, data, _environment(eval_env, 1),
+                       **kwargs)
+
+
+def glm(formula, data, family=None, eval_env=None, **kwargs):
+    import statsmodels.api as sm
+    return cache.model(sm.GLM, formula, data, _environment(eval_env, 1),
+                       family=family, **kwargs)
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def modules():
+    helpers = os.path.join(root, 'helpers')
+    names = []
+    for directory, dirnames, filenames in os.walk(helpers):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.')
+                             and d != '__pycache__')
+        package = os.path.relpath(directory, root).replace(os.sep, '.')
+        names += [package + '.' + f[:-3] for f in sorted(filenames)
+                  if f.endswith('.py') and not f.startswith('__')]
+    return [name for name in names if not name.endswith('.importtime')]
+
+
+def measure(module, repeat=3):
+    # cumulative microseconds of the module's own line in -X importtime
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+            cwd=root, capture_output=True, text=True)
+        if result.returncode:
+            raise ImportError(result.stderr.strip().splitlines()[-1])
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and \
+                    line.split('|')[-1].strip() == module:
+                cumulative = int(line.split('|')[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best / 1000
+
+
+def benchmark(names=None, repeat=3):
+    rows = {}
+    for name in names or modules():
+        try:
+            rows[name] = measure(name, repeat)
+        except ImportError as error:
+            rows[name] = str(error)
+    return rows
+
+
+if __name__ == '__main__':
+    for name, ms in benchmark(sys.argv[1:]).items():
+        print('{:<60} {}'.format(name, ms if isinstance(ms, str) else
+                                 '{:8.1f} ms'.format(ms)))
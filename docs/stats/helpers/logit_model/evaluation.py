@@ -0,0 +1,190 @@
+import numpy as np
+
+bins = 1000
+
+
+def _sorted(y, score):
+    # one sort: positives/negatives at each distinct threshold, descending
+    y = np.asarray(y, dtype=float)
+    score = np.asarray(score, dtype=float)
+    order = np.argsort(-score, kind='stable')
+    score, y = score[order], y[order]
+    last = np.r_[np.flatnonzero(np.diff(score)), len(score) - 1]
+    tps = np.cumsum(y)[last]
+    fps = (last + 1) - tps
+    return np.diff(tps, prepend=0), np.diff(fps, prepend=0), score[last]
+
+
+def _roc(pos, neg, thresholds):
+    tps, fps = np.r_[0, np.cumsum(pos)], np.r_[0, np.cumsum(neg)]
+    return fps / fps[-1], tps / tps[-1], np.r_[np.inf, thresholds]
+
+
+def _pr(pos, neg, thresholds):
+    tps, fps = np.cumsum(pos), np.cumsum(neg)
+    with np.errstate(invalid='ignore'):
+        precision = tps / (tps + fps)
+    keep = tps + fps > 0
+    return precision[keep], tps[keep] / tps[-1], thresholds[keep]
+
+
+def _auc(pos, neg):
+    fpr, tpr, _ = _roc(pos, neg, np.zeros(len(pos)))
+    return (np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2).sum()
+
+
+def _average_precision(pos, neg):
+    precision, recall, _ = _pr(pos, neg, np.zeros(len(pos)))
+    return (np.diff(recall, prepend=0) * precision).sum()
+
+
+def roc(y, score):
+    return _roc(*_sorted(y, score))
+
+
+def pr(y, score):
+    return _pr(*_sorted(y, score))
+
+
+def auc(y, score):
+    return _auc(*_sorted(y, score)[:2])
+
+
+def average_precision(y, score):
+    return _average_precision(*_sorted(y, score)[:2])
+
+
+def _bin(score, bins):
+    return np.clip((score * bins).astype(np.intp), 0, bins - 1)
+
+
+def _calibration(count, positives, score_sum, edges):
+    import pandas as pd
+    keep = count > 0
+    return pd.DataFrame({'lower': edges[:-1][keep], 'upper': edges[1:][keep],
+                         'count': count[keep],
+                         'mean_score': score_sum[keep] / count[keep],
+                         'positive_rate': positives[keep] / count[keep]})
+
+
+def calibration(y, score, groups=10):
+    y = np.asarray(y, dtype=float)
+    score = np.asarray(score, dtype=float)
+    index = _bin(score, groups)
+    return _calibration(np.bincount(index, minlength=groups),
+                        np.bincount(index, y, minlength=groups),
+                        np.bincount(index, score, minlength=groups),
+                        np.linspace(0, 1, groups + 1))
+
+
+def _lift(count, positives, groups):
+    # count/positives are per threshold in descending score order; rows are
+    # assigned to the group holding their cumulative share of the data
+    import pandas as pd
+    share = np.cumsum(count) / count.sum()
+    group = np.minimum((share * groups - 1e-12).astype(int), groups - 1)
+    n = np.bincount(group, count, minlength=groups)
+    hits = np.bincount(group, positives, minlength=groups)
+    rate = positives.sum() / count.sum()
+    return pd.DataFrame({'count': n.astype(int), 'positives': hits,
+                         'positive_rate': hits / n,
+                         'lift': hits / n / rate,
+                         'cumulative_gain': np.cumsum(hits) / hits.sum()},
+                        index=pd.RangeIndex(1, groups + 1, name='group'))
+
+
+def lift(y, score, groups=10):
+    pos, neg, _ = _sorted(y, score)
+    return _lift(pos + neg, pos, groups)
+
+
+class Binned:
+    # mergeable streaming state: label counts and score sums in fixed bins
+    # over [0, 1]; curves are exact up to ties within a bin
+    def __init__(self, bins=bins):
+        self.bins = bins
+        self.positives = np.zeros(bins)
+        self.negatives = np.zeros(bins)
+        self.score_sum = np.zeros(bins)
+
+    def update(self, y, score):
+        y = np.asarray(y, dtype=float)
+        score = np.asarray(score, dtype=float)
+        index = _bin(score, self.bins)
+        positives = np.bincount(index, y, minlength=self.bins)
+        self.positives += positives
+        self.negatives += np.bincount(index, minlength=self.bins) - positives
+        self.score_sum += np.bincount(index, score, minlength=self.bins)
+        return self
+
+    def merge(self, other):
+        self.positives += other.positives
+        self.negatives += other.negatives
+        self.score_sum += other.score_sum
+        return self
+
+    @property
+    def n(self):
+        return int(self.positives.sum() + self.negatives.sum())
+
+    def _descending(self):
+        thresholds = np.arange(self.bins)[::-1] / self.bins
+        return self.positives[::-1], self.negatives[::-1], thresholds
+
+    def roc(self):
+        return _roc(*self._descending())
+
+    def pr(self):
+        return _pr(*self._descending())
+
+    def auc(self):
+        return _auc(*self._descending()[:2])
+
+    def average_precision(self):
+        return _average_precision(*self._descending()[:2])
+
+    def calibration(self, groups=10):
+        merge = np.arange(self.bins) * groups // self.bins
+        return _calibration(
+            np.bincount(merge, self.positives + self.negatives, groups),
+            np.bincount(merge, self.positives, groups),
+            np.bincount(merge, self.score_sum, groups),
+            np.linspace(0, 1, groups + 1))
+
+    def lift(self, groups=10):
+        pos, neg, _ = self._descending()
+        return _lift(pos + neg, pos, groups)
+
+
+def from_chunks(chunks, bins=bins):
+    # chunks: iterable of (y, score) pairs
+    state = Binned(bins)
+    for y, score in chunks:
+        state.update(y, score)
+    return state
+
+
+def plot(y=None, score=None, state=None, groups=10):
+    import matplotlib.pyplot as plt
+    if state is None:
+        fpr, tpr, _ = roc(y, score)
+        precision, recall, _ = pr(y, score)
+        area, table = auc(y, score), calibration(y, score, groups)
+    else:
+        fpr, tpr, _ = state.roc()
+        precision, recall, _ = state.pr()
+        area, table = state.auc(), state.calibration(groups)
+    fig, axes = plt.subplots(1, 3, figsize=(12, 4))
+    axes[0].plot(fpr, tpr, label='AUC = {:.3f}'.format(area))
+    axes[0].plot([0, 1], [0, 1], color='gray', linestyle='--')
+    axes[0].legend(loc='lower right')
+    plt.setp(axes[0], xlabel='偽陽性率', ylabel='真陽性率', title='ROC')
+    axes[1].step(recall, precision, where='post')
+    plt.setp(axes[1], xlabel='再現率', ylabel='適合率', title='PR',
+             ylim=(0, 1.05))
+    axes[2].plot(table['mean_score'], table['positive_rate'], marker='o')
+    axes[2].plot([0, 1], [0, 1], color='gray', linestyle='--')
+    plt.setp(axes[2], xlabel='予測確率', ylabel='実際の割合',
+             title='キャリブレーション')
+    fig.tight_layout()
+    plt.show()
@@ -0,0 +1,134 @@
+from collections import namedtuple
+import time
+import numpy as np
+
+Results = namedtuple('Results', ['params', 'bse', 'llf', 'converged',
+                                 'iterations'])
+
+maxiter = 35
+tol = 1e-8
+
+
+def _outer(X):
+    # (n, p^2) row-wise outer products, so a shared X gives every model's
+    # Hessian as one (B, n) @ (n, p^2) product
+    return (X[:, :, None] * X[:, None, :]).reshape(len(X), -1)
+
+
+def _hessian_score(X, y, w, params, outer=None):
+    # X is (n, p) shared by every model or (B, n, p) with one per model;
+    # newton passes the outer products of a shared X, built once per call
+    if X.ndim == 2:
+        eta = params @ X.T
+    else:
+        eta = np.einsum('bnp,bp->bn', X, params)
+    mu = 1 / (1 + np.exp(-eta))
+    v = w * mu * (1 - mu)
+    r = w * (y - mu)
+    if X.ndim == 2:
+        p = X.shape[1]
+        outer = _outer(X) if outer is None else outer
+        return (v @ outer).reshape(-1, p, p), r @ X
+    return (X * v[:, :, None]).transpose(0, 2, 1) @ X, \
+        np.einsum('bnp,bn->bp', X, r)
+
+
+def newton(X, y, w, maxiter=maxiter, tol=tol):
+    # Newton-Raphson (= IRLS for the logit link) on B models at once;
+    # models drop out of the batch as soon as their step is below tol
+    B = len(w)
+    p = X.shape[-1]
+    params = np.zeros((B, p))
+    iterations = np.zeros(B, dtype=int)
+    active = np.ones(B, dtype=bool)
+    outer = _outer(X) if X.ndim == 2 else None
+    for _ in range(maxiter):
+        index = np.flatnonzero(active)
+        hessian, score = _hessian_score(
+            X if X.ndim == 2 else X[index], y if y.ndim == 1 else y[index],
+            w[index], params[index], outer)
+        try:
+            step = np.linalg.solve(hessian, score[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            step = np.stack([np.linalg.lstsq(h, s, rcond=None)[0]
+                             for h, s in zip(hessian, score)])
+        params[index] += step
+        iterations[index] += 1
+        active[index[np.abs(step).max(axis=1) < tol]] = False
+        if not active.any():
+            break
+    return params, ~active, iterations
+
+
+def _bse(X, y, w, params):
+    hessian = _hessian_score(X, y, w, params)[0]
+    with np.errstate(invalid='ignore'):
+        return np.sqrt(np.diagonal(np.linalg.pinv(hessian), axis1=1, axis2=2))
+
+
+def _llf(X, y, w, params):
+    if X.ndim == 2:
+        eta = params @ X.T
+    else:
+        eta = np.einsum('bnp,bp->bn', X, params)
+    return (w * (y * eta - np.logaddexp(0, eta))).sum(axis=1)
+
+
+def fit(X, y, w=None, maxiter=maxiter, tol=tol):
+    # X: (B, n, p), y: (B, n); zero weights pad models with fewer rows
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    w = np.ones(y.shape) if w is None else np.asarray(w, dtype=float)
+    params, converged, iterations = newton(X, y, w, maxiter, tol)
+    return Results(params, _bse(X, y, w, params), _llf(X, y, w, params),
+                   converged, iterations)
+
+
+def stack(X, y, groups):
+    # one zero-padded (B, n_max, p) problem per group
+    import pandas as pd
+    codes, labels = pd.factorize(np.asarray(groups), sort=True)
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes, minlength=len(labels))
+    position = np.arange(len(codes)) - np.repeat(np.cumsum(counts) - counts,
+                                                 counts)
+    shape = len(labels), counts.max()
+    X_ = np.zeros(shape + (np.shape(X)[1],))
+    y_ = np.zeros(shape)
+    w_ = np.zeros(shape)
+    X_[codes[order], position] = np.asarray(X, dtype=float)[order]
+    y_[codes[order], position] = np.asarray(y, dtype=float)[order]
+    w_[codes[order], position] = 1
+    return X_, y_, w_, labels
+
+
+def fit_groups(X, y, groups, maxiter=maxiter, tol=tol):
+    import pandas as pd
+    names = getattr(X, 'columns', None)
+    X_, y_, w_, labels = stack(X, y, groups)
+    results = fit(X_, y_, w_, maxiter, tol)
+    return Results(pd.DataFrame(results.params, index=labels, columns=names),
+                   pd.DataFrame(results.bse, index=labels, columns=names),
+                   pd.Series(results.llf, index=labels),
+                   pd.Series(results.converged, index=labels),
+                   pd.Series(results.iterations, index=labels))
+
+
+def benchmark(B=1000, n=32, p=4, random_seed=0):
+    import statsmodels.api as sm
+    rng = np.random.default_rng(random_seed)
+    X = rng.normal(size=(B, n, p))
+    X[:, :, 0] = 1
+    beta = rng.normal(scale=0.5, size=(B, p))
+    y = (rng.random((B, n)) < 1 / (1 + np.exp(
+        -np.einsum('bnp,bp->bn', X, beta)))).astype(float)
+    start = time.perf_counter()
+    fit(X, y)
+    batched = time.perf_counter() - start
+    start = time.perf_counter()
+    for Xb, yb in zip(X, y):
+        try:
+            sm.Logit(yb, Xb).fit(disp=0)
+        except Exception:
+            pass
+    return B / batched, B / (time.perf_counter() - start)
@@ -0,0 +1,163 @@
+from collections import namedtuple
+import numpy as np
+from . import irls
+
+Results = namedtuple('Results', ['params', 'llf', 'converged', 'iterations'])
+
+max_dense = 2000
+
+
+def encode(frame, categorical, numeric=(), constant=True):
+    # CSR design from category codes: one stored entry per row and column
+    # group; the first level of each categorical is the reference, except
+    # for the first categorical of a model without a constant, which keeps
+    # all its levels; the categoricals go last in order of cardinality, so
+    # the largest one forms the trailing diagonal block that bse eliminates
+    import pandas as pd
+    from scipy import sparse
+    n = len(frame)
+    rows, cols, values, names = [], [], [], []
+    if constant:
+        rows.append(np.arange(n))
+        cols.append(np.zeros(n, dtype=np.int64))
+        values.append(np.ones(n))
+        names.append('const')
+    for column in numeric:
+        rows.append(np.arange(n))
+        cols.append(np.full(n, len(names), dtype=np.int64))
+        values.append(frame[column].values.astype(float))
+        names.append(column)
+    categoricals = sorted(((column, pd.Categorical(frame[column]))
+                           for column in categorical),
+                          key=lambda item: len(item[1].categories))
+    for i, (column, categories) in enumerate(categoricals):
+        if (categories.codes < 0).any():
+            raise ValueError('{} has missing values'.format(column))
+        drop = int(constant or i > 0)
+        codes = categories.codes.astype(np.int64) - drop
+        keep = codes >= 0
+        rows.append(np.flatnonzero(keep))
+        cols.append(codes[keep] + len(names))
+        values.append(np.ones(keep.sum()))
+        names.extend('{}[{}]'.format(column, level)
+                     for level in categories.categories[drop:])
+    X = sparse.csr_matrix((np.concatenate(values),
+                           (np.concatenate(rows), np.concatenate(cols))),
+                          shape=(n, len(names)))
+    return X, names
+
+
+def predict(params, X):
+    return 1 / (1 + np.exp(-(X @ params)))
+
+
+def _operators(X, XT, squared, mu, alpha):
+    # Hessian-vector product X'(w * Xv) + alpha v and its Jacobi
+    # preconditioner, both O(nnz) per application
+    from scipy.sparse.linalg import LinearOperator
+    p = X.shape[1]
+    w = mu * (1 - mu)
+    diagonal = squared @ w + alpha
+    hessian = LinearOperator((p, p), dtype=float,
+                             matvec=lambda v: XT @ (w * (X @ v)) + alpha * v)
+    preconditioner = LinearOperator((p, p), dtype=float,
+                                    matvec=lambda v: v / diagonal)
+    return hessian, preconditioner
+
+
+def fit(X, y, alpha=0.0, maxiter=irls.maxiter, tol=irls.tol, cg_rtol=1e-10):
+    # truncated Newton: each step solves H s = g by conjugate gradients
+    # with Hessian-vector products X'(w * Xv), so the cost per step is a
+    # few passes over the nonzeros of X; alpha adds an L2 penalty for
+    # levels that would otherwise separate
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.linalg import cg
+    X = csr_matrix(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    XT = X.T.tocsr()
+    squared = X.multiply(X).T.tocsr()
+    p = X.shape[1]
+    params = np.zeros(p)
+    converged = False
+    for iteration in range(1, maxiter + 1):
+        mu = predict(params, X)
+        score = XT @ (y - mu) - alpha * params
+        hessian, preconditioner = _operators(X, XT, squared, mu, alpha)
+        step = cg(hessian, score, rtol=cg_rtol, maxiter=10 * p,
+                  M=preconditioner)[0]
+        params += step
+        if np.abs(step).max() < tol:
+            converged = True
+            break
+    eta = X @ params
+    llf = (y * eta - np.logaddexp(0, eta)).sum()
+    return Results(params, llf, converged, iteration)
+
+
+def information(X, params, alpha=0.0):
+    # sparse normal-equations matrix X'WX (+ alpha I)
+    from scipy import sparse
+    X = sparse.csr_matrix(X, dtype=float)
+    mu = predict(params, X)
+    return (X.T @ sparse.diags(mu * (1 - mu)) @ X +
+            alpha * sparse.identity(X.shape[1])).tocsc()
+
+
+def _diagonal_start(X):
+    # first column s such that no row has two nonzeros in columns s..p-1;
+    # X'WX is then diagonal there (one-hot levels of one categorical)
+    X = X.copy()
+    X.sort_indices()
+    counts = np.diff(X.indptr)
+    rows = np.flatnonzero(counts >= 2)
+    if not len(rows):
+        return 0
+    return int(X.indices[X.indptr[rows + 1] - 2].max()) + 1
+
+
+def _bse_cg(X, params, alpha, columns, cg_rtol):
+    # one preconditioned CG solve H x = e_j per requested column
+    from scipy.sparse.linalg import cg
+    XT = X.T.tocsr()
+    squared = X.multiply(X).T.tocsr()
+    hessian, preconditioner = _operators(X, XT, squared, predict(params, X),
+                                         alpha)
+    p = X.shape[1]
+    out = np.empty(len(columns))
+    for i, j in enumerate(columns):
+        unit = np.zeros(p)
+        unit[j] = 1
+        out[i] = cg(hessian, unit, rtol=cg_rtol, maxiter=10 * p,
+                    M=preconditioner)[0][j]
+    return np.sqrt(out)
+
+
+def bse(X, params, alpha=0.0, columns=None, max_dense=max_dense,
+        cg_rtol=1e-10):
+    # diagonal of the inverse of the arrow-shaped X'WX = [[A, C], [C', D]]
+    # with D diagonal, via the Schur complement S = A - C D^-1 C':
+    #   diag(inv)[:s] = diag(S^-1)
+    #   diag(inv)[s:] = 1/d + rowsum((D^-1 C' S^-1) * D^-1 C')
+    # cost O(nnz + b a^2 + a^3) for a leading and b diagonal columns; a is
+    # the constant, numeric columns and all but the largest categorical.
+    # With columns=[...] only those standard errors are computed, by CG
+    # solves costing O(nnz) per iteration and no dense block at all
+    from scipy import sparse
+    X = sparse.csr_matrix(X, dtype=float)
+    if columns is not None:
+        return _bse_cg(X, params, alpha, columns, cg_rtol)
+    s = _diagonal_start(X)
+    if s > max_dense:
+        raise ValueError(
+            '{} columns outside the largest categorical would need a dense '
+            'inverse; pass columns=[...] to get those standard errors by '
+            'sparse CG solves'.format(s))
+    hessian = information(X, params, alpha)
+    A = hessian[:s, :s].toarray()
+    d = hessian.diagonal()[s:]
+    scaled = sparse.csr_matrix(hessian[:s, s:].T.multiply(1 / d[:, None]))
+    schur = A - (hessian[:s, s:] @ scaled).toarray() if s else A
+    inverse = np.linalg.inv(schur)
+    lower = 1 / d + np.asarray(scaled.multiply(scaled @ inverse)
+                               .sum(axis=1)).ravel()
+    return np.sqrt(np.r_[np.diag(inverse), lower])
@@ -0,0 +1,113 @@
+from collections import namedtuple
+import os
+import numpy as np
+from . import irls
+
+Results = namedtuple('Results', ['params', 'bse', 'tvalues', 'pvalues', 'llf',
+                                 'llnull', 'prsquared', 'aic', 'bic', 'nobs',
+                                 'converged', 'passes'])
+
+chunksize = 1 << 16
+
+
+def chunks(source, x_columns, y_column, chunksize=chunksize, constant=True,
+           **kwargs):
+    # source: a CSV path, or a callable returning an iterable of DataFrames
+    # (so that every pass can start over)
+    import pandas as pd
+    if isinstance(source, (str, os.PathLike)):
+        frames = pd.read_csv(source, usecols=list(x_columns) + [y_column],
+                             chunksize=chunksize, **kwargs)
+    else:
+        frames = source()
+    for frame in frames:
+        X = frame[x_columns].values.astype(float)
+        if constant:
+            X = np.column_stack((np.ones(len(X)), X))
+        yield X, frame[y_column].values.astype(float)
+
+
+def _accumulate(stream, params, hessian=True):
+    # one pass: log-likelihood, score and (optionally) Hessian summed over
+    # the chunks; only one chunk is held in memory at a time
+    p = len(params)
+    llf, n, y_sum = 0.0, 0, 0.0
+    score = np.zeros(p)
+    information = np.zeros((p, p)) if hessian else None
+    for X, y in stream:
+        eta = X @ params
+        mu = 1 / (1 + np.exp(-eta))
+        llf += (y * eta - np.logaddexp(0, eta)).sum()
+        score += X.T @ (y - mu)
+        if hessian:
+            information += (X.T * (mu * (1 - mu))) @ X
+        n += len(y)
+        y_sum += y.sum()
+    return llf, score, information, n, y_sum
+
+
+def _sgd(stream, params, learning_rate):
+    for X, y in stream:
+        mu = 1 / (1 + np.exp(-X @ params))
+        params += learning_rate * X.T @ (y - mu) / len(y)
+    return params
+
+
+def fit(source, x_columns, y_column, method='lbfgs', passes=10, polish=True,
+        learning_rate=0.1, maxiter=irls.maxiter, tol=irls.tol, gtol=1e-5,
+        chunksize=chunksize, constant=True, **kwargs):
+    import pandas as pd
+    from scipy import optimize, stats
+
+    def stream():
+        return chunks(source, x_columns, y_column, chunksize, constant,
+                      **kwargs)
+
+    if method not in ('sgd', 'lbfgs', None):
+        raise ValueError(method)
+    names = (['const'] if constant else []) + list(x_columns)
+    params = np.zeros(len(names))
+    used = 0
+    if method == 'sgd':
+        for epoch in range(passes):
+            params = _sgd(stream(), params, learning_rate / np.sqrt(epoch + 1))
+        used += passes
+    elif method == 'lbfgs':
+        def objective(b):
+            llf, score, _, n, _ = _accumulate(stream(), b, hessian=False)
+            return -llf / n, -score / n
+
+        solution = optimize.minimize(objective, params, jac=True,
+                                     method='L-BFGS-B',
+                                     options={'maxfun': passes})
+        params, used = solution.x, used + solution.nfev
+
+    # Newton polish: one pass per step; the last pass also gives the
+    # Hessian for the standard errors
+    converged = False
+    for _ in range(maxiter if polish else 0):
+        llf, score, information, n, y_sum = _accumulate(stream(), params)
+        used += 1
+        step = np.linalg.solve(information, score)
+        params = params + step
+        if np.abs(step).max() < tol:
+            converged = True
+            break
+    llf, score, information, n, y_sum = _accumulate(stream(), params)
+    used += 1
+    if not polish:
+        # without Newton steps, trust L-BFGS's own stopping rule or a
+        # vanishing mean gradient; plain SGD passes prove nothing
+        converged = bool(np.abs(score).max() / n < gtol) or (
+            method == 'lbfgs' and bool(solution.success))
+
+    bse = np.sqrt(np.diag(np.linalg.inv(information)))
+    tvalues = params / bse
+    p_mean = y_sum / n
+    llnull = n * (p_mean * np.log(p_mean) + (1 - p_mean) * np.log(1 - p_mean))
+    k = len(params)
+    return Results(pd.Series(params, index=names), pd.Series(bse, index=names),
+                   pd.Series(tvalues, index=names),
+                   pd.Series(2 * stats.norm.sf(np.abs(tvalues)), index=names),
+                   llf, llnull, 1 - llf / llnull, -2 * llf + 2 * k,
+                   -2 * llf + np.log(n) * k, n, converged, used)
@@ -0,0 +1,29 @@
+from collections import namedtuple
+import numpy as np
+
+Fit = namedtuple('Fit', ['n', 'x_mean', 'sxx', 'sigma2', 'intercept', 'slope'])
+
+
+def fit(x, y):
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    n = len(x)
+    x_mean, y_mean = x.mean(), y.mean()
+    xc = x - x_mean
+    sxx = xc @ xc
+    slope = xc @ (y - y_mean) / sxx
+    intercept = y_mean - slope * x_mean
+    resid = y - intercept - slope * x
+    return Fit(n, x_mean, sxx, resid @ resid / (n - 2), intercept, slope)
+
+
+def intervals(fit, xx, alphas=0.05):
+    from scipy import stats
+    xx = np.asarray(xx, dtype=float)
+    alphas = np.asarray(alphas, dtype=float)
+    yy = fit.intercept + fit.slope * xx
+    t = stats.t.ppf(1 - alphas / 2, fit.n - 2)[(...,) + (None,) * xx.ndim]
+    leverage = 1 / fit.n + (xx - fit.x_mean) ** 2 / fit.sxx
+    conf = t * np.sqrt(fit.sigma2 * leverage)
+    pred = t * np.sqrt(fit.sigma2 * (1 + leverage))
+    return yy, yy - conf, yy + conf, yy - pred, yy + pred
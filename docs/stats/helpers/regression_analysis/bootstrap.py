@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from ..logit_model import irls
+
+batch_elements = 1 << 22
+
+
+def _counts(rng, size, n):
+    # resample index matrix -> how often each row appears in each resample
+    index = rng.integers(0, n, size=(size, n))
+    index += np.arange(size)[:, None] * n
+    return np.bincount(index.ravel(), minlength=size * n).reshape(size, n)
+
+
+def _outer(X):
+    return (X[:, :, None] * X[:, None, :]).reshape(len(X), -1)
+
+
+def _ols(X, y, seed, size):
+    n, p = X.shape
+    w = _counts(np.random.default_rng(seed), size, n).astype(float)
+    XtX = (w @ _outer(X)).reshape(size, p, p)
+    Xty = w @ (X * y[:, None])
+    return np.linalg.solve(XtX, Xty[:, :, None])[:, :, 0]
+
+
+def _logit(X, y, seed, size, maxiter=irls.maxiter, tol=irls.tol):
+    w = _counts(np.random.default_rng(seed), size, len(X)).astype(float)
+    params, converged, _ = irls.newton(X, y, w, maxiter, tol)
+    params[~converged] = np.nan
+    return params
+
+
+def _run(batch, X, y, n_boot, random_seed, max_workers):
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    size = max(1, min(n_boot, batch_elements // len(X)))
+    sizes = [size] * (n_boot // size)
+    if n_boot % size:
+        sizes.append(n_boot % size)
+    seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+    batch = partial(batch, X, y)
+    if max_workers == 1:
+        return np.concatenate(list(map(batch, seeds, sizes)))
+    with ProcessPoolExecutor(max_workers) as executor:
+        return np.concatenate(list(executor.map(batch, seeds, sizes)))
+
+
+def ols(X, y, n_boot=10000, random_seed=0, max_workers=1):
+    return _run(_ols, X, y, n_boot, random_seed, max_workers)
+
+
+def logit(X, y, n_boot=10000, random_seed=0, max_workers=1):
+    return _run(_logit, X, y, n_boot, random_seed, max_workers)
+
+
+def conf_int(draws, alpha=0.05, names=None):
+    import pandas as pd
+    draws = draws[np.isfinite(draws).all(axis=1)]
+    bounds = np.percentile(draws, [100 * alpha / 2, 100 * (1 - alpha / 2)],
+                           axis=0).T
+    return pd.DataFrame(bounds, index=names)
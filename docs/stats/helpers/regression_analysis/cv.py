@@ -0,0 +1,60 @@
+import numpy as np
+from . import gram
+
+
+def _design(X, y, constant):
+    return gram.design(X, constant)[0], np.asarray(y, dtype=float)
+
+
+def _rows(data, index):
+    return data.iloc[index] if hasattr(data, 'iloc') else data[index]
+
+
+def leverage(X):
+    # diag(H) = row norms of Q, so the n x n hat matrix is never formed
+    Q = np.linalg.qr(np.asarray(X, dtype=float))[0]
+    return (Q ** 2).sum(axis=1)
+
+
+def press(X, y, constant=True):
+    X, y = _design(X, y, constant)
+    Q = np.linalg.qr(X)[0]
+    resid = y - Q @ (Q.T @ y)
+    h = (Q ** 2).sum(axis=1)
+    return ((resid / (1 - h)) ** 2).sum()
+
+
+def loo(X, y, constant=True):
+    return press(X, y, constant) / len(y)
+
+
+def nested_loo(X, y, constant=True):
+    # LOOCV MSE of the models using the first 1, 2, ..., p columns
+    X, y = _design(X, y, constant)
+    Q = np.linalg.qr(X)[0]
+    h = np.cumsum(Q ** 2, axis=1)
+    resid = y[:, None] - np.cumsum(Q * (Q.T @ y), axis=1)
+    mse = ((resid / (1 - h)) ** 2).mean(axis=0)
+    return mse[1:] if constant else mse
+
+
+def folds(n, k=10, random_seed=0):
+    index = np.random.default_rng(random_seed).permutation(n)
+    return np.array_split(index, k)
+
+
+def kfold(g, X, y, k=10, random_seed=0):
+    # g: the cached gram.Gram of (X, y); X and y only supply the rows of
+    # each held-out fold, so they can be memmaps or lazily indexed frames
+    from scipy.linalg import cho_factor, cho_solve
+    constant = 'const' in g.names
+    sse = 0.0
+    for test in folds(g.n, k, random_seed):
+        Xt, yt = _design(_rows(X, test), _rows(y, test), constant)
+        Z = np.column_stack((Xt, yt))
+        # training Gram = cached Gram minus the held-out rows
+        train = g.matrix - Z.T @ Z
+        params = cho_solve(cho_factor(train[:-1, :-1]), train[:-1, -1])
+        resid = yt - Xt @ params
+        sse += resid @ resid
+    return sse / g.n
@@ -0,0 +1,88 @@
+import numpy as np
+from . import gram as gram_
+
+chunksize = 1 << 16
+
+
+def _frame(resid, h, sse, df_resid, index=None):
+    import pandas as pd
+    sigma2 = sse / df_resid
+    internal = resid / np.sqrt(sigma2 * (1 - h))
+    # deleted variance s_(i)^2 without refitting
+    sigma2_i = (sse - resid ** 2 / (1 - h)) / (df_resid - 1)
+    external = resid / np.sqrt(sigma2_i * (1 - h))
+    return pd.DataFrame({'leverage': h, 'resid': resid,
+                         'student_resid_internal': internal,
+                         'student_resid_external': external}, index=index)
+
+
+def _cooks(frame, p):
+    h = frame['leverage']
+    frame['cooks_d'] = frame['student_resid_internal'] ** 2 * h / (
+        p * (1 - h))
+    return frame
+
+
+def influence(X, y, constant=True):
+    index = getattr(X, 'index', None)
+    X, _ = gram_.design(X, constant)
+    y = np.asarray(y, dtype=float)
+    n, p = X.shape
+    Q = np.linalg.qr(X)[0]
+    resid = y - Q @ (Q.T @ y)
+    h = np.einsum('ij,ij->i', Q, Q)
+    return _cooks(_frame(resid, h, resid @ resid, n - p, index), p)
+
+
+def vif(X):
+    import pandas as pd
+    names = getattr(X, 'columns', None)
+    corr = np.corrcoef(np.asarray(X, dtype=float), rowvar=False)
+    return pd.Series(np.diag(np.linalg.inv(corr)), index=names)
+
+
+def gram_vif(g):
+    import pandas as pd
+    if 'const' not in g.names:
+        raise ValueError('VIF needs a Gram matrix with a constant column')
+    index = [i for i, name in enumerate(g.names) if name != 'const']
+    xx = g.matrix[:-1, :-1]
+    mean = xx[g.names.index('const')] / g.n
+    cov = xx - g.n * np.outer(mean, mean)
+    cov = cov[np.ix_(index, index)]
+    scale = np.sqrt(np.diag(cov))
+    corr = cov / np.outer(scale, scale)
+    return pd.Series(np.diag(np.linalg.inv(corr)),
+                     index=[g.names[i] for i in index])
+
+
+def chunks(g, frames, x_columns, y_column):
+    # second pass over the data: one DataFrame of diagnostics per chunk
+    from scipy.linalg import cho_solve, solve_triangular
+    xx, xy = g.matrix[:-1, :-1], g.matrix[:-1, -1]
+    cholesky = np.linalg.cholesky(xx)
+    params = cho_solve((cholesky, True), xy)
+    sse = g.matrix[-1, -1] - params @ xy
+    p = len(params)
+    inverse = solve_triangular(cholesky, np.eye(p), lower=True)
+    constant = 'const' in g.names
+    for frame in frames:
+        X, _ = gram_.design(frame[x_columns], constant)
+        resid = frame[y_column].values - X @ params
+        w = X @ inverse.T
+        h = np.einsum('ij,ij->i', w, w)
+        yield _cooks(_frame(resid, h, sse, g.n - p, frame.index), p)
+
+
+def read_csv(path, x_columns, y_column, constant=True, chunksize=chunksize,
+             **kwargs):
+    import pandas as pd
+    usecols = list(x_columns) + [y_column]
+
+    def frames():
+        return pd.read_csv(path, usecols=usecols, chunksize=chunksize,
+                           **kwargs)
+
+    g = gram_.from_chunks(frames(), x_columns, y_column, constant)
+    return gram_vif(g) if constant else None, chunks(g, frames(), x_columns,
+                                                     y_column)
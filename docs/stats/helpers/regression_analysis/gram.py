@@ -0,0 +1,158 @@
+from collections import namedtuple
+import numpy as np
+
+Gram = namedtuple('Gram', ['matrix', 'names', 'n'])
+Fit = namedtuple('Fit', ['params', 'rss', 'rsquared', 'rsquared_adj', 'aic',
+                         'bic'])
+
+
+def design(X, constant=True):
+    names = list(X.columns) if hasattr(X, 'columns') else [
+        'x{}'.format(i + 1) for i in range(np.shape(X)[1])]
+    X = np.asarray(X, dtype=float)
+    if constant:
+        X = np.column_stack((np.ones(len(X)), X))
+        names = ['const'] + names
+    return X, names
+
+
+def gram(X, y, constant=True):
+    X, names = design(X, constant)
+    Z = np.column_stack((X, np.asarray(y, dtype=float)))
+    return Gram(Z.T @ Z, names, len(Z))
+
+
+def from_chunks(chunks, x_columns, y_column, constant=True):
+    matrix, n = 0, 0
+    for chunk in chunks:
+        g = gram(chunk[x_columns], chunk[y_column], constant)
+        matrix, n, names = matrix + g.matrix, n + g.n, g.names
+    return Gram(matrix, names, n)
+
+
+def _index(g, columns):
+    return [c if isinstance(c, (int, np.integer)) else g.names.index(c)
+            for c in columns]
+
+
+def _tss(g, has_constant):
+    yy = g.matrix[-1, -1]
+    if not has_constant:
+        return yy
+    return yy - g.matrix[g.names.index('const'), -1] ** 2 / g.n
+
+
+def _criteria(rss, n, k):
+    llf = -n / 2 * (np.log(2 * np.pi) + np.log(rss / n) + 1)
+    return -2 * llf + 2 * k, -2 * llf + np.log(n) * k
+
+
+def fit(g, columns=None):
+    import pandas as pd
+    from scipy.linalg import cho_factor, cho_solve
+    index = _index(g, g.names if columns is None else columns)
+    xx = g.matrix[np.ix_(index, index)]
+    xy = g.matrix[index, -1]
+    params = cho_solve(cho_factor(xx), xy)
+    rss = g.matrix[-1, -1] - params @ xy
+    has_constant = 'const' in [g.names[i] for i in index]
+    rsquared = 1 - rss / _tss(g, has_constant)
+    k = len(index)
+    rsquared_adj = 1 - (g.n - has_constant) / (g.n - k) * (1 - rsquared)
+    aic, bic = _criteria(rss, g.n, k)
+    return Fit(pd.Series(params, index=[g.names[i] for i in index]), rss,
+               rsquared, rsquared_adj, aic, bic)
+
+
+def sweep(A, k, reverse=False):
+    d = A[k, k]
+    row = A[k].copy()
+    A -= np.outer(A[:, k], row) / d
+    sign = -1 if reverse else 1
+    A[k] = sign * row / d
+    A[:, k] = sign * row / d
+    A[k, k] = -1 / d
+    return A
+
+
+def _score(rss, n, k, criterion):
+    aic, bic = _criteria(rss, n, k)
+    return aic if criterion == 'aic' else bic
+
+
+def forward(g, criterion='aic', keep=('const',)):
+    A = g.matrix.copy()
+    selected = [i for i in _index(g, [k for k in keep if k in g.names])]
+    for i in selected:
+        sweep(A, i)
+    best = _score(A[-1, -1], g.n, len(selected), criterion)
+    while True:
+        candidates = np.array([i for i in range(len(g.names))
+                               if i not in selected], dtype=int)
+        if not candidates.size:
+            break
+        rss = A[-1, -1] - A[candidates, -1] ** 2 / A[candidates, candidates]
+        scores = _score(rss, g.n, len(selected) + 1, criterion)
+        if scores.min() >= best:
+            break
+        best = scores.min()
+        selected.append(int(candidates[scores.argmin()]))
+        sweep(A, selected[-1])
+    return [g.names[i] for i in selected]
+
+
+def backward(g, criterion='aic', keep=('const',)):
+    A = g.matrix.copy()
+    selected = list(range(len(g.names)))
+    for i in selected:
+        sweep(A, i)
+    fixed = set(_index(g, [k for k in keep if k in g.names]))
+    best = _score(A[-1, -1], g.n, len(selected), criterion)
+    while True:
+        candidates = np.array([i for i in selected if i not in fixed],
+                              dtype=int)
+        if not candidates.size:
+            break
+        rss = A[-1, -1] + A[candidates, -1] ** 2 / -A[candidates, candidates]
+        scores = _score(rss, g.n, len(selected) - 1, criterion)
+        if scores.min() >= best:
+            break
+        best = scores.min()
+        drop = int(candidates[scores.argmin()])
+        selected.remove(drop)
+        sweep(A, drop, reverse=True)
+    return [g.names[i] for i in selected]
+
+
+def best_subset(g, criterion='aic', keep=('const',), max_size=None,
+                top=None):
+    import pandas as pd
+    fixed = _index(g, [k for k in keep if k in g.names])
+    free = [i for i in range(len(g.names)) if i not in fixed]
+    codes = np.arange(2 ** len(free))
+    bits = (codes[:, None] >> np.arange(len(free))) & 1
+    if max_size is not None:
+        bits = bits[bits.sum(axis=1) <= max_size]
+    masks = np.zeros((len(bits), len(g.names)))
+    masks[:, fixed] = 1
+    masks[:, free] = bits
+
+    xx, xy = g.matrix[:-1, :-1], g.matrix[:-1, -1]
+    systems = xx * masks[:, :, None] * masks[:, None, :]
+    systems += np.eye(len(xx)) * (1 - masks)[:, None, :]
+    params = np.linalg.solve(systems, (xy * masks)[:, :, None])[:, :, 0]
+    rss = g.matrix[-1, -1] - params @ xy
+    k = masks.sum(axis=1)
+    aic, bic = _criteria(rss, g.n, k)
+    tss = np.full(len(masks), _tss(g, False))
+    if 'const' in g.names:
+        tss[masks[:, g.names.index('const')] > 0] = _tss(g, True)
+    order = np.argsort(aic if criterion == 'aic' else bic, kind='stable')
+    if top is not None:
+        order = order[:top]
+    names = np.array(g.names, dtype=object)
+    return pd.DataFrame({
+        'variables': [tuple(names[masks[i] > 0]) for i in order],
+        'k': k[order].astype(int), 'rss': rss[order],
+        'rsquared': 1 - rss[order] / tss[order],
+        'aic': aic[order], 'bic': bic[order]})
@@ -1,52 +1,73 @@
+from functools import lru_cache
 import numpy as np
-from sklearn.datasets import make_regression
-import statsmodels.api as sm
-from statsmodels.sandbox.regression.predstd import wls_prediction_std
-from ipywidgets import interact, FloatSlider
-import matplotlib.pyplot as plt
-
-x, y = make_regression(n_samples=30, n_features=1, n_informative=1,
-                       noise=20.0, random_state=1)
-X = sm.add_constant(x)
-
-def plot_conf_itvl(ax, xlim, fitted_model, alpha, color, transparency):
-    xx = np.linspace(xlim[0], xlim[1], 30)
-    yy = fitted_model.predict(sm.add_constant(xx))
-    mean_x = x.mean()
-    n = len(x)
-    dof = fitted_model.df_resid
-    from scipy import stats
-    t = stats.t.ppf(1 - alpha / 2, df=fitted_model.df_resid)
-    sq_err = (fitted_model.resid ** 2).sum()
-    conf = t * np.sqrt((sq_err / dof) * (1.0 / n + (xx - mean_x) ** 2 /
-                       ((xx ** 2).sum() - n * mean_x ** 2)))
-    upper = yy + abs(conf)
-    lower = yy - abs(conf)
-    ax.fill_between(xx, lower, upper, color=color, alpha=transparency,
-                    label='信頼区間')
-
-def plot_pred_itvl(ax, xlim, fitted_model, alpha, color, transparency):
-    std, lower, upper = wls_prediction_std(fitted_model, sm.add_constant(xlim),
-                                           alpha=alpha)
-    ax.fill_between(xlim, lower, upper, color=color, alpha=transparency,
-                    label='予測区間')
+from . import bands
 
-def plot(conf_alpha, pred_alpha):
-    plt.figure(figsize=(5, 5))
-    ax = plt.axes()
-    ax.scatter(x, y)
-    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+alphas = np.round(np.arange(0.01, 0.505, 0.01), 2)
+
+@lru_cache(maxsize=1)
+def data():
+    from sklearn.datasets import make_regression
+    x, y = make_regression(n_samples=30, n_features=1, n_informative=1,
+                           noise=20.0, random_state=1)
+    return x.ravel(), y
 
-    fitted_model = sm.OLS(y, X).fit()
+@lru_cache(maxsize=1)
+def fitted():
+    return bands.fit(*data())
 
-    plot_conf_itvl(ax, xlim, fitted_model, conf_alpha, 'blue', 0.4)
-    plot_pred_itvl(ax, xlim, fitted_model, pred_alpha, 'blue', 0.1)
+@lru_cache(maxsize=1)
+def table():
+    x, y = data()
+    margin = 0.05 * (x.max() - x.min())
+    xx = np.linspace(x.min() - margin, x.max() + margin, 30)
+    return xx, bands.intervals(fitted(), xx, alphas)
 
+def band(alpha, kind):
+    xx, (yy, conf_lower, conf_upper, pred_lower, pred_upper) = table()
+    i = np.flatnonzero(np.isclose(alphas, alpha))
+    if len(i):
+        lower, upper = {'conf': (conf_lower, conf_upper),
+                        'pred': (pred_lower, pred_upper)}[kind]
+        return xx, lower[i[0]], upper[i[0]]
+    _, conf_lower, conf_upper, pred_lower, pred_upper = bands.intervals(
+        fitted(), xx, alpha)
+    if kind == 'conf':
+        return xx, conf_lower, conf_upper
+    return xx, pred_lower, pred_upper
+
+def polygon(xx, lower, upper):
+    return np.concatenate((np.column_stack((xx, lower)),
+                           np.column_stack((xx, upper))[::-1]))
+
+def figure():
+    import matplotlib.pyplot as plt
+    x, y = data()
+    fig, ax = plt.subplots(figsize=(5, 5))
+    ax.scatter(x, y)
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    xx, yy = table()[0], table()[1][0]
+    conf = ax.fill_between(xx, yy, yy, color='blue', alpha=0.4,
+                           label='信頼区間')
+    pred = ax.fill_between(xx, yy, yy, color='blue', alpha=0.1,
+                           label='予測区間')
     ax.legend()
     plt.setp(ax, xlim=xlim, ylim=ylim, xticks=(), yticks=())
+    return fig, conf, pred
+
+def update(conf, pred, conf_alpha, pred_alpha):
+    conf.set_verts([polygon(*band(conf_alpha, 'conf'))])
+    pred.set_verts([polygon(*band(pred_alpha, 'pred'))])
+
+def plot(conf_alpha, pred_alpha):
+    import matplotlib.pyplot as plt
+    fig, conf, pred = figure()
+    update(conf, pred, conf_alpha, pred_alpha)
     plt.show()
 
 def show():
+    from ipywidgets import FloatSlider, Output, VBox
+    from IPython.display import display
+    import matplotlib.pyplot as plt
     style=dict(description_width='7em')
     conf_alpha = FloatSlider(value=0.05, min=0.01, max=0.5, step=0.01,
                              description='信頼区間の係数', readout_format='.2f',
@@ -54,4 +75,19 @@ def show():
     pred_alpha = FloatSlider(value=0.05, min=0.01, max=0.5, step=0.01,
                              description='予測区間の係数', readout_format='.2f',
                              continuous_update=False, style=style)
-    interact(plot, conf_alpha=conf_alpha, pred_alpha=pred_alpha)
+
+    fig, conf, pred = figure()
+    plt.close(fig)
+    output = Output()
+
+    def redraw(change=None):
+        update(conf, pred, conf_alpha.value, pred_alpha.value)
+        fig.canvas.draw_idle()
+        with output:
+            output.clear_output(wait=True)
+            display(fig)
+
+    conf_alpha.observe(redraw, names='value')
+    pred_alpha.observe(redraw, names='value')
+    redraw()
+    display(VBox([conf_alpha, pred_alpha, output]))
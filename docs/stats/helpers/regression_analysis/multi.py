@@ -0,0 +1,50 @@
+from collections import namedtuple
+import time
+import numpy as np
+from . import gram as gram_
+
+Results = namedtuple('Results', ['params', 'bse', 'tvalues', 'rsquared',
+                                 'rsquared_adj', 'df_resid'])
+
+
+def fit(X, Y, constant=True):
+    # one QR of X shared by every column of Y
+    import pandas as pd
+    from scipy.linalg import solve_triangular
+    X, names = gram_.design(X, constant)
+    responses = getattr(Y, 'columns', None)
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    n, p = X.shape
+    Q, R = np.linalg.qr(X)
+    QtY = Q.T @ Y
+    params = solve_triangular(R, QtY)
+    sse = ((Y - Q @ QtY) ** 2).sum(axis=0)
+    df_resid = n - p
+    # diag((X'X)^-1) = squared row norms of R^-1
+    inverse = solve_triangular(R, np.eye(p))
+    bse = np.sqrt(np.outer((inverse ** 2).sum(axis=1), sse / df_resid))
+    tss = ((Y - Y.mean(axis=0)) ** 2).sum(axis=0) if constant else \
+        (Y ** 2).sum(axis=0)
+    rsquared = 1 - sse / tss
+    rsquared_adj = 1 - (n - constant) / df_resid * (1 - rsquared)
+
+    def frame(values):
+        return pd.DataFrame(values, index=names, columns=responses)
+
+    return Results(frame(params), frame(bse), frame(params / bse),
+                   pd.Series(rsquared, index=responses),
+                   pd.Series(rsquared_adj, index=responses), df_resid)
+
+
+def benchmark(X, Y, constant=True):
+    import statsmodels.api as sm
+    start = time.perf_counter()
+    fit(X, Y, constant)
+    batched = time.perf_counter() - start
+    exog = sm.add_constant(X) if constant else X
+    start = time.perf_counter()
+    for column in np.asarray(Y, dtype=float).T:
+        sm.OLS(column, exog).fit()
+    return batched, time.perf_counter() - start
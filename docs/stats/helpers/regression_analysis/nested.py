@@ -0,0 +1,39 @@
+import numpy as np
+
+
+def rss(X, y):
+    X = np.asarray(X, dtype=float)
+    residual = np.asarray(y, dtype=float).copy()
+    n, p = X.shape
+    Q = np.empty((n, p))
+    out = np.empty(p)
+    rank = 0
+    for k in range(p):
+        v = X[:, k].copy()
+        for _ in range(2):
+            v -= Q[:, :rank] @ (Q[:, :rank].T @ v)
+        norm = np.sqrt(v @ v)
+        if norm > 1e-10 * np.sqrt(X[:, k] @ X[:, k]):
+            Q[:, rank] = v / norm
+            residual -= (Q[:, rank] @ residual) * Q[:, rank]
+            rank += 1
+        out[k] = residual @ residual
+    return out
+
+
+def r2(X, y, constant=False):
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if constant:
+        X = np.column_stack((np.ones(n), X))
+        tss = ((y - y.mean()) ** 2).sum()
+    else:
+        tss = y @ y
+    ssr = rss(X, y)
+    k = np.arange(1, X.shape[1] + 1)
+    rsquared = 1 - ssr / tss
+    rsquared_adj = 1 - (n - constant) / (n - k) * (1 - rsquared)
+    if constant:
+        rsquared, rsquared_adj = rsquared[1:], rsquared_adj[1:]
+    return rsquared, rsquared_adj
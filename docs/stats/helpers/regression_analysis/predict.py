@@ -0,0 +1,79 @@
+from collections import namedtuple
+import time
+import numpy as np
+
+Model = namedtuple('Model', ['params', 'cholesky', 'sigma2', 'df_resid'])
+
+chunksize = 1 << 16
+
+
+def fit(X, y):
+    from scipy.linalg import cho_solve
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    cholesky = np.linalg.cholesky(X.T @ X)
+    params = cho_solve((cholesky, True), X.T @ y)
+    resid = y - X @ params
+    df_resid = X.shape[0] - X.shape[1]
+    return Model(params, cholesky, resid @ resid / df_resid, df_resid)
+
+
+def from_results(results):
+    exog = np.asarray(results.model.exog, dtype=float)
+    return Model(np.asarray(results.params), np.linalg.cholesky(exog.T @ exog),
+                 results.scale, results.df_resid)
+
+
+def memmap(path, n):
+    return np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                     shape=(n, 2))
+
+
+def intervals(model, X0, alpha=0.05, kind='pred', out=None,
+              chunksize=chunksize):
+    from scipy import stats
+    from scipy.linalg import solve_triangular
+    if kind not in ('pred', 'conf'):
+        raise ValueError(kind)
+    n = len(X0)
+    if out is None:
+        out = np.empty((n, 2))
+    t = stats.t.ppf(1 - alpha / 2, model.df_resid)
+    extra = 1.0 if kind == 'pred' else 0.0
+    p = len(model.params)
+    # x0 @ [L^-T | params] gives L^-1 x0 and the fitted mean in one GEMM
+    inverse = solve_triangular(model.cholesky, np.eye(p), lower=True)
+    weights = np.column_stack((inverse.T, model.params))
+    for start in range(0, n, chunksize):
+        chunk = np.asarray(X0[start:start + chunksize], dtype=float)
+        w = chunk @ weights
+        mean = w[:, p]
+        leverage = (w[:, :p] ** 2).sum(axis=1)
+        half = t * np.sqrt(model.sigma2 * (extra + leverage))
+        out[start:start + len(chunk), 0] = mean - half
+        out[start:start + len(chunk), 1] = mean + half
+    return out
+
+
+def read_csv(model, path, columns, out, alpha=0.05, kind='pred',
+             chunksize=chunksize, constant=True, **kwargs):
+    import pandas as pd
+    start = 0
+    for frame in pd.read_csv(path, usecols=columns, chunksize=chunksize,
+                             **kwargs):
+        chunk = frame[columns].values
+        if constant:
+            chunk = np.column_stack((np.ones(len(chunk)), chunk))
+        intervals(model, chunk, alpha, kind, out[start:start + len(chunk)],
+                  chunksize)
+        start += len(chunk)
+    return out
+
+
+def benchmark(model, n=10 ** 6, random_seed=0, **kwargs):
+    p = len(model.params)
+    X0 = np.random.default_rng(random_seed).normal(size=(n, p))
+    X0[:, 0] = 1
+    start = time.perf_counter()
+    intervals(model, X0, **kwargs)
+    return n / (time.perf_counter() - start)
@@ -1,28 +1,54 @@
+from functools import lru_cache
 import numpy as np
-import pandas as pd
-from sklearn.datasets import make_regression
-import statsmodels.api as sm
-from ipywidgets import interact, IntSlider
+from . import cv, nested
+
+k_max = 100
+
+
+@lru_cache(maxsize=1)
+def data():
+    import pandas as pd
+    from sklearn.datasets import make_regression
+    X, y = make_regression(n_samples=1000, n_features=2, n_informative=2,
+                           noise=20.0, random_state=1)
+    noise = np.random.RandomState(0).normal(size=(len(X), k_max - 2))
+    X_large = np.hstack((X, noise))
+    return pd.DataFrame(X_large, columns=['X{}'.format(i+1)
+                                          for i in range(k_max)]), y
+
+
+@lru_cache(maxsize=1)
+def curve():
+    import pandas as pd
+    df, y = data()
+    rsquared, rsquared_adj = nested.r2(df.values, y)
+    mse = cv.nested_loo(df.values, y, constant=False)
+    return pd.DataFrame({'R^2': rsquared, 'Adjusted R^2': rsquared_adj,
+                         'LOOCV MSE': mse},
+                        index=pd.RangeIndex(1, k_max + 1, name='k'))
 
-X, y = make_regression(n_samples=1000, n_features=2, n_informative=2,
-                       noise=20.0, random_state=1)
 
 def r2(k):
-    if k > 2:
-        np.random.seed(0)
-        X_large = np.hstack((X, np.random.normal(size=(1000, k - 2))))
-    else:
-        X_large = X
-    df = pd.DataFrame(X_large, columns=['X{}'.format(i+1) for i in range(k)])
-    result = sm.OLS(endog=y, exog=df).fit()
-    print(df.tail())
-    print()
-    print('決定係数 (R^2)                     :{0:.3f}'.format(result.rsquared))
-    print('自由度調整済み決定係数 (Adjusted R^2):{0:.3f}'.format(result.rsquared_adj))
+    import matplotlib.pyplot as plt
+    df, _ = data()
+    print(df.iloc[:, :k].tail())
     print()
-    print(result.summary())
+    print('決定係数 (R^2)                     :{0:.3f}'.format(
+        curve().loc[k, 'R^2']))
+    print('自由度調整済み決定係数 (Adjusted R^2):{0:.3f}'.format(
+        curve().loc[k, 'Adjusted R^2']))
+    print('交差検証誤差 (LOOCV MSE)           :{0:.1f}'.format(
+        curve().loc[k, 'LOOCV MSE']))
+
+    ax = curve().loc[2:].plot(figsize=(8, 4), secondary_y='LOOCV MSE')
+    ax.axvline(k, color='gray', linestyle='--')
+    plt.setp(ax, xlabel='変数の数', ylabel='決定係数')
+    ax.right_ax.set_ylabel('交差検証誤差')
+    plt.show()
+
 
 def show():
-    k = IntSlider(value=2, min=2, max=100, continuous_update=False,
+    from ipywidgets import interact, IntSlider
+    k = IntSlider(value=2, min=2, max=k_max, continuous_update=False,
                   description='変数の数')
     interact(r2, k=k)
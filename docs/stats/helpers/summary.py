@@ -0,0 +1,230 @@
+from functools import cached_property
+import numpy as np
+from .logit_model import irls
+
+
+class _Results:
+    # every statistic is computed on first access and then cached
+    scalars = ()
+    vectors = ('params', 'bse', 'tvalues', 'pvalues')
+
+    def __init__(self, X, y):
+        self.names = list(X.columns) if hasattr(X, 'columns') else [
+            'x{}'.format(i + 1) for i in range(np.shape(X)[1])]
+        self.exog = np.asarray(X, dtype=float)
+        self.endog = np.asarray(y, dtype=float)
+        self.nobs, self.k = self.exog.shape
+
+    @cached_property
+    def has_constant(self):
+        return bool((np.ptp(self.exog, axis=0) == 0).any())
+
+    @cached_property
+    def df_model(self):
+        return self.k - self.has_constant
+
+    @cached_property
+    def df_resid(self):
+        return self.nobs - self.k
+
+    @cached_property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @cached_property
+    def aic(self):
+        return -2 * self.llf + 2 * self.k
+
+    @cached_property
+    def bic(self):
+        return -2 * self.llf + np.log(self.nobs) * self.k
+
+
+class OLS(_Results):
+    scalars = ('nobs', 'rsquared', 'rsquared_adj', 'fvalue', 'f_pvalue',
+               'llf', 'aic', 'bic', 'condition_number', 'durbin_watson',
+               'omnibus', 'omnibus_pvalue', 'jarque_bera',
+               'jarque_bera_pvalue')
+
+    @cached_property
+    def _qr(self):
+        return np.linalg.qr(self.exog)
+
+    @cached_property
+    def params(self):
+        from scipy.linalg import solve_triangular
+        Q, R = self._qr
+        return solve_triangular(R, Q.T @ self.endog)
+
+    @cached_property
+    def resid(self):
+        return self.endog - self.exog @ self.params
+
+    @cached_property
+    def ssr(self):
+        return self.resid @ self.resid
+
+    @cached_property
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cached_property
+    def bse(self):
+        from scipy.linalg import solve_triangular
+        inverse = solve_triangular(self._qr[1], np.eye(self.k))
+        return np.sqrt((inverse ** 2).sum(axis=1) * self.scale)
+
+    @cached_property
+    def pvalues(self):
+        from scipy import stats
+        return 2 * stats.t.sf(np.abs(self.tvalues), self.df_resid)
+
+    @cached_property
+    def centered_tss(self):
+        centered = self.endog - self.endog.mean()
+        return centered @ centered
+
+    @cached_property
+    def uncentered_tss(self):
+        return self.endog @ self.endog
+
+    @cached_property
+    def rsquared(self):
+        tss = self.centered_tss if self.has_constant else self.uncentered_tss
+        return 1 - self.ssr / tss
+
+    @cached_property
+    def rsquared_adj(self):
+        return 1 - (self.nobs - self.has_constant) / self.df_resid * (
+            1 - self.rsquared)
+
+    @cached_property
+    def fvalue(self):
+        return (self.rsquared / self.df_model) / (
+            (1 - self.rsquared) / self.df_resid)
+
+    @cached_property
+    def f_pvalue(self):
+        from scipy import stats
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    @cached_property
+    def llf(self):
+        n = self.nobs
+        return -n / 2 * (np.log(2 * np.pi) + np.log(self.ssr / n) + 1)
+
+    @cached_property
+    def condition_number(self):
+        s = np.linalg.svd(self.exog, compute_uv=False)
+        return s[0] / s[-1]
+
+    @cached_property
+    def durbin_watson(self):
+        return (np.diff(self.resid) ** 2).sum() / self.ssr
+
+    @cached_property
+    def _jarque_bera(self):
+        from scipy import stats
+        return stats.jarque_bera(self.resid)
+
+    @cached_property
+    def jarque_bera(self):
+        return float(self._jarque_bera[0])
+
+    @cached_property
+    def jarque_bera_pvalue(self):
+        return float(self._jarque_bera[1])
+
+    @cached_property
+    def _omnibus(self):
+        from scipy import stats
+        return stats.normaltest(self.resid)
+
+    @cached_property
+    def omnibus(self):
+        return float(self._omnibus[0])
+
+    @cached_property
+    def omnibus_pvalue(self):
+        return float(self._omnibus[1])
+
+
+class Logit(_Results):
+    scalars = ('nobs', 'converged', 'llf', 'llnull', 'prsquared', 'llr',
+               'llr_pvalue', 'aic', 'bic')
+
+    maxiter = irls.maxiter
+    tol = irls.tol
+
+    @cached_property
+    def _newton(self):
+        params, converged, _ = irls.newton(
+            self.exog, self.endog, np.ones((1, self.nobs)), self.maxiter,
+            self.tol)
+        return params[0], bool(converged[0])
+
+    @cached_property
+    def params(self):
+        return self._newton[0]
+
+    @cached_property
+    def converged(self):
+        return self._newton[1]
+
+    @cached_property
+    def fittedvalues(self):
+        return self.exog @ self.params
+
+    @cached_property
+    def bse(self):
+        mu = 1 / (1 + np.exp(-self.fittedvalues))
+        hessian = (self.exog.T * (mu * (1 - mu))) @ self.exog
+        return np.sqrt(np.diag(np.linalg.inv(hessian)))
+
+    @cached_property
+    def pvalues(self):
+        from scipy import stats
+        return 2 * stats.norm.sf(np.abs(self.tvalues))
+
+    @cached_property
+    def llf(self):
+        eta = self.fittedvalues
+        return (self.endog * eta - np.logaddexp(0, eta)).sum()
+
+    @cached_property
+    def llnull(self):
+        p = self.endog.mean()
+        return self.nobs * (p * np.log(p) + (1 - p) * np.log(1 - p))
+
+    @cached_property
+    def prsquared(self):
+        return 1 - self.llf / self.llnull
+
+    @cached_property
+    def llr(self):
+        return 2 * (self.llf - self.llnull)
+
+    @cached_property
+    def llr_pvalue(self):
+        from scipy import stats
+        return stats.chi2.sf(self.llr, self.df_model)
+
+
+def to_frame(results, fields=None, index=None):
+    # one row per model: scalars as columns, vectors as (field, name)
+    import pandas as pd
+    results = list(results)
+    if fields is None:
+        fields = results[0].scalars + results[0].vectors
+    columns = {}
+    for field in fields:
+        values = np.array([getattr(r, field) for r in results])
+        if field in results[0].vectors:
+            for name, column in zip(results[0].names, values.T):
+                columns[(field, name)] = column
+        else:
+            columns[(field, '')] = values
+    frame = pd.DataFrame(columns, index=index)
+    if all(name == '' for _, name in frame.columns):
+        frame.columns = frame.columns.droplevel(1)
+    return frame